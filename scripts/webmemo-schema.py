@@ -1,31 +1,36 @@
 # webmemo-schema.py
 # Schema.org data collection and management for Webmemo.ch
 
-import requests
-import json
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+import re
+import orjson
+import ijson
+import itertools
 import pandas as pd
+import gspread
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 import argparse
 import os
-import time
+import sys
+import pickle
+import functools
+import hashlib
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Determine if we're running in Colab or not
-try:
-    # This will only work in Google Colab
-    from google.colab import auth as colab_auth, drive
-    import gspread
-    from oauth2client.client import GoogleCredentials
-    IN_COLAB = True
+# Determine if we're running in Colab or not; the Colab runtime has already
+# imported google.colab, so there is no need to try importing it here
+IN_COLAB = 'google.colab' in sys.modules
+if IN_COLAB:
     print("Running in Google Colab environment")
-except ImportError:
+else:
     # For non-Colab environments (GitHub Actions, local machine)
-    import gspread
-    from google.oauth2.service_account import Credentials
-    IN_COLAB = False
     print("Running in standard Python environment")
 
 # Get credentials from environment variables
@@ -33,8 +38,9 @@ WP_API_USER = os.getenv('WP_API_TESTER')
 WP_API_PASSWORD = os.getenv('WP_API_PW')
 
 # Configuration
-WP_API_BASE = 'https://webmemo.ch/wp-json/wp/v2'
-SCHEMA_API_BASE = 'https://webmemo.ch/wp-json/webmemo-schema/v1'
+WP_JSON_BASE = 'https://webmemo.ch/wp-json'
+WP_API_BASE = f'{WP_JSON_BASE}/wp/v2'
+SCHEMA_ROUTE = '/webmemo-schema/v1/schemas'
 ENDPOINTS = {
     'posts': f'{WP_API_BASE}/posts',
     'pages': f'{WP_API_BASE}/pages',
@@ -42,20 +48,90 @@ ENDPOINTS = {
     'tags': f'{WP_API_BASE}/tags',
     'users': f'{WP_API_BASE}/users',
     'media': f'{WP_API_BASE}/media',
-    'schema': f'{SCHEMA_API_BASE}/schemas'
+    'schema': f'{WP_JSON_BASE}{SCHEMA_ROUTE}',
+    'batch': f'{WP_JSON_BASE}/batch/v1'
 }
 
+# Publisher referenced by every Article (shared, as schemas are serialized right away)
+PUBLISHER = {"@id": "https://webmemo.ch/#consulting"}
+
+# WordPress accepts at most 25 sub-requests per batch request by default
+BATCH_MAX_REQUESTS = 25
+
+# Maximum number of schema batches uploaded at the same time
+UPLOAD_CONCURRENCY = 5
+
+# Statuses worth retrying a batch on, and how often to retry
+UPLOAD_RETRY_STATUSES = {429, 502, 503, 504}
+UPLOAD_RETRIES = 3
+
+# Post and page fields used by the sheets and the schemas; _embed needs _links
+POST_FIELDS = 'id,slug,title,date,modified,link,featured_media,_links,_embedded'
+
+# Maximum number of simultaneous connections to the WordPress server
+MAX_CONNECTIONS = 10
+
+# Maximum number of pages requested per second while validating
+VALIDATION_RATE_LIMIT = 10
+
+# JSON-LD script blocks in a fetched page (matched on the raw response bytes),
+# regardless of attribute order, quoting or tag case
+JSONLD_PATTERN = re.compile(
+    rb'<script[^>]*type=["\']?application/ld\+json["\']?[^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Number of rows sent to Google Sheets per request
+SHEET_BATCH_ROWS = 2000
+
+# Google Sheets API statuses that are worth retrying
+SHEETS_RETRY_STATUSES = {429, 500, 502, 503}
+
+# Directory for data kept between runs
+CACHE_DIR = os.path.expanduser(os.getenv('WEBMEMO_CACHE_DIR', '~/.webmemo_cache'))
+
+class Cache:
+    """Persistent key-value store backed by a pickle file in CACHE_DIR"""
+    
+    def __init__(self, filename):
+        self.path = os.path.join(CACHE_DIR, filename)
+        try:
+            with open(self.path, 'rb') as f:
+                self.entries = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.entries = {}
+    
+    def get(self, key):
+        return self.entries.get(key)
+    
+    def set(self, key, value):
+        self.entries[key] = value
+    
+    def save(self):
+        """Write the cache to disk, replacing the previous file atomically"""
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self.entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+@functools.lru_cache(maxsize=1)
 def authenticate():
-    """Authenticate with Google services based on environment"""
+    """Authenticate with Google services based on environment (once per run)"""
     print("Authenticating with Google...")
     
     if IN_COLAB:
         # Colab-specific authentication
+        from google.colab import auth as colab_auth, drive
+        from oauth2client.client import GoogleCredentials
+        
         colab_auth.authenticate_user()
         drive.mount('/content/drive')
         return gspread.authorize(GoogleCredentials.get_application_default())
     else:
         # Standard service account authentication
+        from google.oauth2.service_account import Credentials
+        
         credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
         if not credentials_path:
             raise ValueError("GOOGLE_APPLICATION_CREDENTIALS environment variable not set")
@@ -69,69 +145,112 @@ def authenticate():
         credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
         return gspread.authorize(credentials)
 
-def fetch_all_pages(endpoint, params=None):
+async def fetch_page(session, endpoint, params, cache):
+    """Fetch a single page from a WordPress REST API endpoint"""
+    key = (endpoint, tuple(sorted(params.items())))
+    cached = cache.get(key)
+    
+    # Ask the server to skip the body if the page hasn't changed since the last run
+    headers = {}
+    if cached:
+        etag, last_modified, _, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    async with session.get(endpoint, params=params, headers=headers) as response:
+        if response.status == 304 and cached:
+            _, _, items, total_pages = cached
+            return items, total_pages
+        
+        if response.status != 200:
+            print(f"Error fetching page {params['page']} from {endpoint}: {response.status}")
+            return [], 0
+        
+        # WordPress reports the page count on every paginated response
+        total_pages = response.headers.get('X-WP-TotalPages')
+        total_pages = int(total_pages) if total_pages is not None else None
+        
+        # Parse items as the body streams in rather than buffering the whole page first
+        items = [item async for item in ijson.items(response.content, 'item', use_float=True)]
+    
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        cache.set(key, (etag, last_modified, items, total_pages))
+    
+    return items, total_pages
+
+async def fetch_all_pages_async(session, endpoint, cache, params=None):
     """Fetch all pages from a paginated WordPress REST API endpoint"""
-    if params is None:
-        params = {}
+    params = dict(params or {})
     
     # Default to 100 items per page
     params.setdefault('per_page', 100)
-    params.setdefault('page', 1)
-    
-    all_items = []
     
     print(f"Fetching data from {endpoint}...")
     
-    while True:
-        response = requests.get(endpoint, params=params)
-        
-        # Break if we get an error
-        if response.status_code != 200:
-            print(f"Error fetching data from {endpoint}: {response.status_code}")
-            break
-        
-        # Get the items from the current page
-        items = response.json()
-        
-        # If no items were returned, break
-        if not items:
-            break
-        
-        # Add the items to our list
-        all_items.extend(items)
-        
-        # Move to the next page
-        params['page'] += 1
+    # The first page tells us how many pages there are in total
+    items, total_pages = await fetch_page(session, endpoint, {**params, 'page': 1}, cache)
+    all_items = list(items)
+    
+    if total_pages is None:
+        # Without a page count, keep requesting pages until one comes back empty
+        page = 2
+        while items:
+            items, _ = await fetch_page(session, endpoint, {**params, 'page': page}, cache)
+            all_items.extend(items)
+            page += 1
+    else:
+        # Fetch the remaining pages concurrently
+        pages = await asyncio.gather(*[
+            fetch_page(session, endpoint, {**params, 'page': page}, cache)
+            for page in range(2, total_pages + 1)
+        ])
+        for items, _ in pages:
+            all_items.extend(items)
     
     print(f"Retrieved {len(all_items)} items from {endpoint}")
     return all_items
 
-def fetch_data():
-    """Fetch all necessary data from WordPress"""
-    data = {}
-    
-    # Fetch posts with metadata (author, categories, tags, featured image)
-    data['posts'] = fetch_all_pages(ENDPOINTS['posts'], {
-        '_embed': True,  # Include embedded data like author, featured image
-        'status': 'publish'  # Only published posts
-    })
-    
-    # Fetch pages
-    data['pages'] = fetch_all_pages(ENDPOINTS['pages'], {
-        '_embed': True,
-        'status': 'publish'
-    })
+async def fetch_data_async():
+    """Fetch all necessary data from WordPress concurrently"""
+    fetch_params = {
+        # Posts with metadata (author, categories, tags, featured image)
+        'posts': {
+            '_embed': 1,  # Include embedded data like author, featured image
+            '_fields': POST_FIELDS,
+            'status': 'publish'  # Only published posts
+        },
+        'pages': {
+            '_embed': 1,
+            '_fields': POST_FIELDS,
+            'status': 'publish'
+        },
+        'users': None,
+        'categories': None,
+        'tags': None
+    }
     
-    # Fetch authors/users
-    data['users'] = fetch_all_pages(ENDPOINTS['users'])
+    cache = Cache('responses.pkl')
     
-    # Fetch categories
-    data['categories'] = fetch_all_pages(ENDPOINTS['categories'])
+    # Share one session across all endpoints so connections are kept alive
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*[
+            fetch_all_pages_async(session, ENDPOINTS[entity_type], cache, params)
+            for entity_type, params in fetch_params.items()
+        ])
     
-    # Fetch tags
-    data['tags'] = fetch_all_pages(ENDPOINTS['tags'])
+    cache.save()
     
-    return data
+    return dict(zip(fetch_params, results))
+
+@functools.lru_cache(maxsize=1)
+def fetch_data():
+    """Fetch all necessary data from WordPress (memoized for the current run)"""
+    return asyncio.run(fetch_data_async())
 
 def generate_person_schema(user_data):
     """Generate Schema.org Person markup for a WordPress user"""
@@ -159,6 +278,14 @@ def generate_person_schema(user_data):
     
     return schema
 
+@functools.lru_cache(maxsize=512)
+def author_ref(slug):
+    """Schema.org reference to an author, shared by all posts of that author"""
+    return {
+        "@type": "Person",
+        "@id": f"https://webmemo.ch/author/{slug}"
+    }
+
 def generate_article_schema(post_data):
     """Generate Schema.org Article markup for a WordPress post"""
     schema = {
@@ -168,13 +295,8 @@ def generate_article_schema(post_data):
         "datePublished": post_data['date'],
         "dateModified": post_data['modified'],
         "url": post_data['link'],
-        "author": {
-            "@type": "Person",
-            "@id": f"https://webmemo.ch/author/{post_data['_embedded']['author'][0]['slug']}"
-        },
-        "publisher": {
-            "@id": "https://webmemo.ch/#consulting"
-        },
+        "author": author_ref(post_data['_embedded']['author'][0]['slug']),
+        "publisher": PUBLISHER,
         "mainEntityOfPage": {
             "@type": "WebPage",
             "@id": post_data['link']
@@ -211,29 +333,133 @@ def generate_article_schema(post_data):
     
     return schema
 
-def save_to_sheet(gc, data, sheet_name):
-    """Save data to a Google Sheet"""
+def project_post(post_data):
+    """Extract the sheet columns for a WordPress post or page"""
+    embedded = post_data.get('_embedded', {})
+    author = (embedded.get('author') or [{}])[0]
+    media = (embedded.get('wp:featuredmedia') or [{}])[0]
+    
+    return {
+        'id': post_data['id'],
+        'slug': post_data['slug'],
+        'title': post_data['title']['rendered'],
+        'date': post_data['date'],
+        'link': post_data['link'],
+        'author': author.get('slug', ''),
+        'featured_media': media.get('source_url', '')
+    }
+
+def project_user(user_data):
+    """Extract the sheet columns for a WordPress user"""
+    return {
+        'id': user_data['id'],
+        'slug': user_data['slug'],
+        'name': user_data['name'],
+        'link': user_data.get('link', '')
+    }
+
+def project_term(term_data):
+    """Extract the sheet columns for a WordPress category or tag"""
+    return {
+        'id': term_data['id'],
+        'slug': term_data['slug'],
+        'name': term_data['name'],
+        'count': term_data.get('count', 0),
+        'link': term_data.get('link', '')
+    }
+
+# Sheet columns to keep for each fetched entity type
+PROJECTORS = {
+    'posts': project_post,
+    'pages': project_post,
+    'users': project_user,
+    'categories': project_term,
+    'tags': project_term
+}
+
+def is_flat(data):
+    """Check whether data is a list of dicts without nested dicts or lists"""
+    return not data or (
+        isinstance(data[0], dict)
+        and not any(isinstance(value, (dict, list)) for value in data[0].values())
+    )
+
+def is_transient_sheets_error(error):
+    """Check whether a Google Sheets API error is likely to go away on retry"""
+    return isinstance(error, APIError) and error.response.status_code in SHEETS_RETRY_STATUSES
+
+# Retry transient Google Sheets API errors with exponential backoff
+sheets_retry = retry(
+    wait=wait_exponential(),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(is_transient_sheets_error),
+    reraise=True
+)
+
+@sheets_retry
+def open_or_create_sheet(gc, sheet_name):
+    """Open a Google Sheet by name, creating it only if it doesn't exist"""
+    try:
+        return gc.open(sheet_name)
+    except SpreadsheetNotFound:
+        return gc.create(sheet_name)
+
+@sheets_retry
+def write_rows(worksheet, row, values):
+    """Write rows of values to a worksheet starting at the given row"""
+    worksheet.batch_update([{
+        'range': gspread.utils.rowcol_to_a1(row, 1),
+        'values': values
+    }], value_input_option='RAW')
+
+def save_to_sheet(gc, data, sheet_name, projector=None):
+    """Save data to a Google Sheet
+    
+    A projector maps each item to the flat dict of columns to keep, so
+    nested WordPress responses never go through pd.json_normalize. Flat
+    items are written as they are, without building a DataFrame.
+    """
     try:
-        # Convert data to DataFrame
-        df = pd.json_normalize(data)
+        if projector is not None:
+            data = [projector(item) for item in data]
+        
+        if is_flat(data):
+            # Columns in first-seen order; items missing a column get an empty cell
+            header = list(dict.fromkeys(key for item in data for key in item))
+            row_count = len(data)
+            chunks = (
+                [[item.get(key, '') for key in header] for item in data[start:start + SHEET_BATCH_ROWS]]
+                for start in range(0, row_count, SHEET_BATCH_ROWS)
+            )
+        else:
+            df = pd.json_normalize(data)
+            header = df.columns.tolist()
+            row_count = len(df)
+            chunks = (
+                df.iloc[start:start + SHEET_BATCH_ROWS].values.tolist()
+                for start in range(0, row_count, SHEET_BATCH_ROWS)
+            )
         
         # Create or open the sheet
-        try:
-            sheet = gc.open(sheet_name)
-        except:
-            sheet = gc.create(sheet_name)
+        sheet = open_or_create_sheet(gc, sheet_name)
         
         # Get or create worksheet
         try:
-            worksheet = sheet.get_worksheet(0)
-        except:
-            worksheet = sheet.add_worksheet(title="Data", rows=1, cols=1)
+            worksheet = sheets_retry(sheet.get_worksheet)(0)
+        except WorksheetNotFound:
+            worksheet = sheets_retry(sheet.add_worksheet)(title="Data", rows=1, cols=1)
         
         # Clear worksheet
-        worksheet.clear()
+        sheets_retry(worksheet.clear)()
+        
+        # Size the worksheet once so Sheets doesn't grow it with every batch
+        sheets_retry(worksheet.resize)(rows=row_count + 1, cols=max(len(header), 1))
         
-        # Update with data
-        worksheet.update([df.columns.tolist()] + df.values.tolist())
+        # Write the header once, then the rows below it one batch at a time so only
+        # a single batch of cell values exists at once; RAW skips Sheets' formula parsing
+        write_rows(worksheet, 1, [header])
+        for number, chunk in enumerate(chunks):
+            write_rows(worksheet, number * SHEET_BATCH_ROWS + 2, chunk)
         
         print(f"Saved {len(data)} items to Google Sheet: {sheet_name}")
         
@@ -244,139 +470,198 @@ def save_to_sheet(gc, data, sheet_name):
 
 def generate_schemas(data):
     """Generate Schema.org JSON-LD for all entities"""
-    schemas = []
-    
-    # Generate Person schemas for users
-    for user in data['users']:
-        schema = generate_person_schema(user)
-        schemas.append({
-            'object_id': user['id'],
-            'object_type': 'user',
-            'schema_type': 'Person',
-            'schema_data': json.dumps(schema),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    # Generate Article schemas for posts
-    for post in data['posts']:
-        schema = generate_article_schema(post)
-        schemas.append({
-            'object_id': post['id'],
-            'object_type': 'post',
-            'schema_type': 'Article',
-            'schema_data': json.dumps(schema),
-            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        })
-    
-    # Add more schema generators as needed (WebPage, Product, etc.)
-    
-    return schemas
-
-def upload_schemas(schemas, batch_size=50):
-    """Upload schemas to WordPress via REST API"""
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    entities = itertools.chain(
+        # Person schemas for users
+        ((user['id'], 'user', 'Person', generate_person_schema(user)) for user in data['users']),
+        # Article schemas for posts
+        ((post['id'], 'post', 'Article', generate_article_schema(post)) for post in data['posts']),
+        # Add more schema generators as needed (WebPage, Product, etc.)
+    )
+    
+    return [
+        {
+            'object_id': object_id,
+            'object_type': object_type,
+            'schema_type': schema_type,
+            'schema_data': orjson.dumps(schema).decode(),
+            'last_updated': now_str
+        }
+        for object_id, object_type, schema_type, schema in entities
+    ]
+
+def schema_hash(schema):
+    """Hash the generated JSON-LD of a schema; last_updated is deliberately left out"""
+    return hashlib.blake2b(schema['schema_data'].encode(), digest_size=16).hexdigest()
+
+def schema_key(schema):
+    """Identify the WordPress object a schema belongs to"""
+    return (schema['object_type'], schema['object_id'], schema['schema_type'])
+
+async def upload_batch(session, semaphore, batch, batch_number):
+    """Upload one batch of schemas, returning (uploaded_schemas, error_count)"""
+    # Each schema becomes one sub-request; none run unless all validate
+    payload = {
+        'validation': 'require-all-validate',
+        'requests': [
+            {'method': 'POST', 'path': SCHEMA_ROUTE, 'body': schema}
+            for schema in batch
+        ]
+    }
+    
+    try:
+        async with semaphore:
+            delay = 0.1
+            for attempt in range(UPLOAD_RETRIES + 1):
+                # This is a placeholder for the actual API request
+                # You would need to implement authentication
+                async with session.post(ENDPOINTS['batch'], json=payload) as response:
+                    if response.status not in UPLOAD_RETRY_STATUSES or attempt == UPLOAD_RETRIES:
+                        status = response.status
+                        # The batch endpoint answers 207 Multi-Status with one response per sub-request
+                        result = await response.json() if status in (200, 207) else None
+                        break
+                
+                # Back off only while the server is throttling us or briefly unavailable
+                await asyncio.sleep(delay)
+                delay *= 2
+    except Exception as e:
+        print(f"Error uploading batch {batch_number}: {e}")
+        return [], len(batch)
+    
+    if result is None:
+        print(f"Batch {batch_number}: Failed with status {status}")
+        return [], len(batch)
+    
+    # A failed validation means no sub-request was executed
+    if result.get('failed'):
+        print(f"Batch {batch_number}: Rejected, {result['failed']} failed")
+        return [], len(batch)
+    
+    uploaded = []
+    for schema, item in zip(batch, result.get('responses', [])):
+        if 200 <= item['status'] < 300:
+            uploaded.append(schema)
+        else:
+            print(f"Error uploading {schema['object_type']} {schema['object_id']}: {item['status']}")
+    batch_errors = len(batch) - len(uploaded)
+    
+    print(f"Batch {batch_number}: Uploaded {len(uploaded)} schemas, {batch_errors} errors")
+    return uploaded, batch_errors
+
+async def upload_schemas_async(schemas, batch_size=BATCH_MAX_REQUESTS):
+    """Upload schemas to WordPress via the REST API batch endpoint concurrently"""
     # This would require authentication and API access
     # You would need to implement WordPress authentication
     
     # Example code - not functional without proper auth
-    total_success = 0
-    total_errors = 0
     
-    # Split into batches
-    for i in range(0, len(schemas), batch_size):
-        batch = schemas[i:i+batch_size]
-        
-        try:
-            # This is a placeholder for the actual API request
-            # You would need to implement authentication
-            response = requests.post(
-                ENDPOINTS['schema'],
-                json={'schemas': batch},
-                # Add authentication here
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                batch_success = len(result.get('success', []))
-                batch_errors = len(result.get('errors', []))
-                
-                total_success += batch_success
-                total_errors += batch_errors
-                
-                print(f"Batch {i//batch_size + 1}: Uploaded {batch_success} schemas, {batch_errors} errors")
-            else:
-                print(f"Batch {i//batch_size + 1}: Failed with status {response.status_code}")
-                total_errors += len(batch)
-            
-        except Exception as e:
-            print(f"Error uploading batch {i//batch_size + 1}: {e}")
-            total_errors += len(batch)
-        
-        # Sleep to avoid overwhelming the server
-        time.sleep(1)
+    # Only upload schemas whose JSON-LD changed since their last successful upload
+    hashes = Cache('schema_hashes.pkl')
+    changed = [schema for schema in schemas if hashes.get(schema_key(schema)) != schema_hash(schema)]
+    if len(changed) < len(schemas):
+        print(f"Skipping {len(schemas) - len(changed)} unchanged schemas")
+    
+    semaphore = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+    
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(*[
+            upload_batch(session, semaphore, changed[i:i+batch_size], i//batch_size + 1)
+            for i in range(0, len(changed), batch_size)
+        ])
+    
+    for uploaded, _ in results:
+        for schema in uploaded:
+            hashes.set(schema_key(schema), schema_hash(schema))
+    hashes.save()
+    
+    total_success = sum(len(uploaded) for uploaded, _ in results)
+    total_errors = sum(errors for _, errors in results)
     
     print(f"Schema upload complete! Success: {total_success}, Errors: {total_errors}")
     return total_success, total_errors
 
-def validate_schemas(urls):
-    """Validate Schema.org implementations on given URLs"""
+def upload_schemas(schemas, batch_size=BATCH_MAX_REQUESTS):
+    """Upload schemas to WordPress via REST API"""
+    return asyncio.run(upload_schemas_async(schemas, batch_size))
+
+async def validate_url(session, url, semaphore, limiter):
+    """Validate the Schema.org implementation on a single URL"""
     results = []
     
-    for url in urls:
-        print(f"Validating {url}...")
-        
-        try:
-            # Fetch the page
-            response = requests.get(url)
-            
-            if response.status_code != 200:
-                print(f"Error fetching {url}: {response.status_code}")
-                continue
-            
-            # Use regex to extract JSON-LD scripts (more reliable than BeautifulSoup for JSON-LD)
-            pattern = r'<script type="application/ld\+json">(.*?)</script>'
-            matches = re.findall(pattern, response.text, re.DOTALL)
-            
-            if not matches:
-                print(f"No Schema.org JSON-LD found on {url}")
-                continue
+    try:
+        async with semaphore, limiter:
+            print(f"Validating {url}...")
             
-            # Parse and validate each script
-            for i, script_content in enumerate(matches):
-                try:
-                    # Parse the JSON
-                    schema_data = json.loads(script_content)
-                    
-                    # Extract the Schema type
-                    schema_type = schema_data.get('@type', 'Unknown')
-                    
-                    # Add to results
-                    results.append({
-                        'url': url,
-                        'schema_index': i,
-                        'schema_type': schema_type,
-                        'valid_json': True,
-                        'schema_data': json.dumps(schema_data)
-                    })
-                    
-                except json.JSONDecodeError as e:
-                    print(f"Invalid JSON in schema #{i} on {url}: {e}")
-                    results.append({
-                        'url': url,
-                        'schema_index': i,
-                        'schema_type': 'Invalid JSON',
-                        'valid_json': False,
-                        'error': str(e),
-                        'schema_data': script_content
-                    })
+            # Fetch the page
+            async with session.get(url) as response:
+                if response.status != 200:
+                    print(f"Error fetching {url}: {response.status}")
+                    return results
+                
+                content = await response.read()
         
-        except Exception as e:
-            print(f"Error validating {url}: {e}")
+        # Use regex to extract JSON-LD scripts (more reliable than BeautifulSoup for JSON-LD)
+        matches = [match.group(1) for match in JSONLD_PATTERN.finditer(content)]
         
-        # Sleep to avoid too many requests
-        time.sleep(1)
+        if not matches:
+            print(f"No Schema.org JSON-LD found on {url}")
+            return results
+        
+        # Parse and validate each script
+        for i, script_content in enumerate(matches):
+            try:
+                # Parse the JSON
+                schema_data = orjson.loads(script_content)
+                
+                # Extract the Schema type
+                schema_type = schema_data.get('@type', 'Unknown')
+                
+                # Add to results
+                results.append({
+                    'url': url,
+                    'schema_index': i,
+                    'schema_type': schema_type,
+                    'valid_json': True,
+                    'schema_data': orjson.dumps(schema_data).decode()
+                })
+                
+            except orjson.JSONDecodeError as e:
+                print(f"Invalid JSON in schema #{i} on {url}: {e}")
+                results.append({
+                    'url': url,
+                    'schema_index': i,
+                    'schema_type': 'Invalid JSON',
+                    'valid_json': False,
+                    'error': str(e),
+                    'schema_data': script_content.decode('utf-8', 'replace')
+                })
+    
+    except Exception as e:
+        print(f"Error validating {url}: {e}")
     
     return results
 
+async def validate_schemas_async(urls):
+    """Validate Schema.org implementations on given URLs concurrently"""
+    semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+    limiter = AsyncLimiter(VALIDATION_RATE_LIMIT, 1)
+    
+    # At most two connections per host keeps us polite without sleeping between pages
+    connector = aiohttp.TCPConnector(limit_per_host=2)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        url_results = await asyncio.gather(*[
+            validate_url(session, url, semaphore, limiter) for url in urls
+        ])
+    
+    return [result for results in url_results for result in results]
+
+def validate_schemas(urls):
+    """Validate Schema.org implementations on given URLs"""
+    return asyncio.run(validate_schemas_async(urls))
+
 def main():
     parser = argparse.ArgumentParser(description='Schema.org data collection and management for Webmemo.ch')
     parser.add_argument('--fetch', action='store_true', help='Fetch data from WordPress')
@@ -402,12 +687,13 @@ def main():
         
         # Save data to Google Sheets
         for entity_type, entity_data in data.items():
-            save_to_sheet(gc, entity_data, f"Webmemo {entity_type.capitalize()}")
+            save_to_sheet(gc, entity_data, f"Webmemo {entity_type.capitalize()}",
+                          projector=PROJECTORS.get(entity_type))
     
     if args.all or args.generate:
         print("=== Generating Schema.org data ===")
-        # Either load data from sheets or fetch again
-        data = fetch_data()  # For simplicity, we're fetching again
+        # fetch_data() is memoized, so this reuses the fetch step's data with --all
+        data = fetch_data()
         
         schemas = generate_schemas(data)
         